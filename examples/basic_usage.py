@@ -1,5 +1,6 @@
 """Example usage script demonstrating the healthdcat_converter package."""
 
+import sys
 from pathlib import Path
 from healthdcat_converter import CSVtoRDFConverter
 
@@ -28,16 +29,14 @@ def main():
 
     # Convert CSV to RDF format
     try:
-        rdf_output = converter.convert(
+        # Write the RDF straight to stdout instead of building a string
+        converter.convert(
             format="turtle",
             dataset_uri="http://example.org/health/dataset/sample",
             validate=True,
+            out=sys.stdout,
         )
 
-        # print("=" * 60)
-        print(rdf_output)
-        # print("=" * 60)
-
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("\nPlease ensure the sample CSV file exists in the data/ directory.")
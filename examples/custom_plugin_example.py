@@ -4,6 +4,9 @@ from pathlib import Path
 from typing import Any, Dict, List
 from healthdcat_converter import CSVtoRDFConverter, PluginBase
 
+# Sentinel for missing keys, distinct from any CSV value
+_MISSING = object()
+
 
 # Define a custom plugin inline (normally this would be in the plugins/ directory)
 class CustomFilterPlugin(PluginBase):
@@ -35,11 +38,18 @@ class CustomFilterPlugin(PluginBase):
         if not filter_key:
             return data
 
-        filtered = [
-            row
-            for row in data
-            if isinstance(row, dict) and row.get(filter_key) == filter_value
-        ]
+        # Bind locals for the comprehension; None matches missing keys too
+        fk, fv = filter_key, filter_value
+        if fv is None:
+            filtered = [
+                row for row in data if isinstance(row, dict) and row.get(fk) is None
+            ]
+        else:
+            filtered = [
+                row
+                for row in data
+                if isinstance(row, dict) and row.get(fk, _MISSING) == fv
+            ]
 
         print(f"Filtered {len(data)} rows down to {len(filtered)} rows")
         return filtered
@@ -1,10 +1,90 @@
 """Main converter class for CSV to RDF conversion using the plugin system."""
 
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Union
 
 from .plugin_loader import PluginLoader
 
+# Number of CSV chunks the reader thread may buffer ahead of validation
+PIPELINE_QUEUE_SIZE = 4
+
+_DONE = object()
+
+
+def _prefetch(
+    items: Iterable[Any], maxsize: int = PIPELINE_QUEUE_SIZE
+) -> Generator[Any, None, None]:
+    """
+    Iterate over items produced by a background thread.
+
+    The producer runs up to maxsize items ahead of the consumer, so reading
+    the next chunk overlaps with processing the current one. Exceptions
+    raised by the producer are re-raised in the consumer. Closing the
+    generator early stops the producer and joins its thread.
+
+    Args:
+        items: Iterable to consume in the background
+        maxsize: Maximum number of buffered items
+
+    Yields:
+        Items from the iterable, in order
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Block until there is room, giving up if the consumer went away
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _convert_file(csv_file: str, options: Dict[str, Any]) -> Any:
+    """
+    Convert a single CSV file; run in worker processes by convert_many.
+
+    Args:
+        csv_file: Path to the CSV file to convert
+        options: Keyword arguments for CSVtoRDFConverter.convert
+
+    Returns:
+        RDF data returned by convert
+    """
+    return CSVtoRDFConverter(csv_file).convert(**options)
+
 
 class CSVtoRDFConverter:
     """
@@ -27,63 +107,174 @@ class CSVtoRDFConverter:
         if auto_load_plugins:
             self.plugin_loader.load_plugins()
 
-    def convert(self, **kwargs) -> str:
+    def convert(self, **kwargs) -> Any:
         """
         Convert CSV file to RDF format using the plugin pipeline.
 
         Args:
             **kwargs: Additional options:
-                - format: RDF serialization format (default: 'turtle')
+                - format: RDF serialization format (default: 'turtle'),
+                  including the binary 'jelly' and 'jelly-noprefix-sm'
                 - dataset_uri: Base URI for the dataset
                 - validate: Run validation before conversion (default: True)
                 - required_fields: List of required fields for validation
+                - chunk_size: Stream the CSV file in batches of this many rows
+                  instead of loading it into memory. Batches are read in a
+                  background thread while earlier ones are validated. The
+                  table schema is inferred from the first batch and
+                  ``self.data`` is not set.
+                - sample_size: Number of non-empty values per column used to
+                  infer its datatype (default: 64). Raise it when a column's
+                  first values aren't representative; with chunk_size, only
+                  the first batch is sampled
+                - out: Text stream or file path to write the RDF to instead
+                  of returning it
 
         Returns:
-            RDF data as a string
+            RDF data as a string, or bytes for Jelly (empty when out is given)
 
         Raises:
-            ValueError: If validation fails
+            ValueError: If validation fails, or sample_size is less than 1
             FileNotFoundError: If CSV file doesn't exist
         """
         validate = kwargs.get("validate", True)
+        chunk_size = kwargs.get("chunk_size")
+        required_fields = kwargs.get("required_fields", [])
+        allow_empty = kwargs.get("allow_empty", True)
 
         # Step 1: Read CSV file using the CSV reader plugin
-        csv_reader = self.plugin_loader.get_plugin("csv_reader")()
-        self.data = csv_reader.execute(self.csv_file)
-
-        # Step 2: Validate data if requested
-        if validate:
-            validator = self.plugin_loader.get_plugin("validator")()
-            validation_result = validator.execute(
-                self.data,
-                required_fields=kwargs.get("required_fields", []),
-                allow_empty=kwargs.get("allow_empty", True),
-            )
-
-            if not validation_result["valid"]:
-                error_msg = "Validation failed:\n" + "\n".join(
-                    validation_result["errors"]
-                )
-                raise ValueError(error_msg)
+        csv_reader = self.plugin_loader.get_instance("csv_reader")
+
+        if chunk_size is not None:
+            # Stream batches through validation, keeping only the first one
+            # as a sample for schema inference
+            self.data = None
+            sample: List[Dict[str, Any]] = []
+            num_rows = 0
+            result = {"valid": True, "errors": [], "warnings": []}
+            validator = self.plugin_loader.get_instance("validator")
+
+            chunks = csv_reader.execute(self.csv_file, chunk_size=chunk_size)
+            for chunk in _prefetch(chunks):
+                if not sample:
+                    sample = chunk
+                if validate:
+                    chunk_result = validator.execute(
+                        chunk,
+                        required_fields=required_fields,
+                        allow_empty=allow_empty,
+                        row_offset=num_rows,
+                    )
+                    result["valid"] = result["valid"] and chunk_result["valid"]
+                    result["errors"].extend(chunk_result["errors"])
+                    result["warnings"].extend(chunk_result["warnings"])
+                num_rows += len(chunk)
 
-            # Log warnings if any
-            if validation_result["warnings"]:
-                print("Validation warnings:")
-                for warning in validation_result["warnings"]:
-                    print(f"  - {warning}")
+            if validate:
+                if num_rows == 0:
+                    result = validator.execute([])
+                self._check_validation(result)
+            data = sample
+        else:
+            data = csv_reader.execute(self.csv_file)
+            self.data = data
+            num_rows = len(data)
+
+            # Step 2: Validate data if requested
+            if validate:
+                validator = self.plugin_loader.get_instance("validator")
+                validation_result = validator.execute(
+                    data,
+                    required_fields=required_fields,
+                    allow_empty=allow_empty,
+                )
+                self._check_validation(validation_result)
 
         # Step 3: Generate RDF using the RDF generator plugin
-        rdf_generator = self.plugin_loader.get_plugin("rdf_generator")()
+        rdf_generator = self.plugin_loader.get_instance("rdf_generator")
         rdf_output = rdf_generator.execute(
-            self.data,
+            data,
             format=kwargs.get("format", "turtle"),
             dataset_uri=kwargs.get(
                 "dataset_uri", f"http://example.org/dataset/{self.csv_file.stem}"
             ),
+            num_rows=num_rows,
+            sample_size=kwargs.get("sample_size"),
+            out=kwargs.get("out"),
         )
 
         return rdf_output
 
+    @classmethod
+    def convert_many(
+        cls,
+        csv_files: Sequence[Union[str, Path]],
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[Any]:
+        """
+        Convert several CSV files in parallel worker processes.
+
+        Each file goes through the same plugin pipeline as convert(), in its
+        own CSVtoRDFConverter; files are independent, so throughput grows
+        with the number of cores.
+
+        Workers are started with forkserver or spawn, which re-import the
+        main module; scripts must call this under an
+        ``if __name__ == "__main__":`` guard.
+
+        Args:
+            csv_files: Paths to the CSV files to convert
+            workers: Number of worker processes (default: os.cpu_count()).
+                With a single worker or file, files are converted in this
+                process.
+            **kwargs: Options passed to convert() for every file, except out
+
+        Returns:
+            RDF data of each file, in the order of csv_files
+
+        Raises:
+            ValueError: If validation of a file fails, or out is given
+            FileNotFoundError: If a CSV file doesn't exist
+        """
+        if "out" in kwargs:
+            raise ValueError("convert_many returns the RDF data; out is not supported")
+
+        paths = [str(csv_file) for csv_file in csv_files]
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return [_convert_file(path, kwargs) for path in paths]
+
+        # Forking a process that runs reader threads can deadlock the child,
+        # so workers are started from a clean interpreter instead
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        else:
+            context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(_convert_file, paths, [kwargs] * len(paths)))
+
+    def _check_validation(self, validation_result: Dict[str, Any]) -> None:
+        """
+        Raise on validation errors and print any validation warnings.
+
+        Args:
+            validation_result: Result dictionary returned by the validator plugin
+
+        Raises:
+            ValueError: If validation failed
+        """
+        if not validation_result["valid"]:
+            error_msg = "Validation failed:\n" + "\n".join(validation_result["errors"])
+            raise ValueError(error_msg)
+
+        # Log warnings if any
+        if validation_result["warnings"]:
+            print("Validation warnings:")
+            for warning in validation_result["warnings"]:
+                print(f"  - {warning}")
+
     def list_available_plugins(self) -> List[str]:
         """
         List all available plugins.
@@ -117,6 +308,6 @@ class CSVtoRDFConverter:
         Returns:
             Plugin execution result
         """
-        plugin = self.get_plugin(plugin_name)()
+        plugin = self.plugin_loader.get_instance(plugin_name)
         input_data = data if data is not None else self.data
         return plugin.execute(input_data, **kwargs)
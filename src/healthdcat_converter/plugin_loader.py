@@ -1,12 +1,24 @@
 """Plugin loader that automatically discovers and loads plugins."""
 
+import contextlib
 import importlib
+import json
+import os
 import pkgutil
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from .plugin_base import PluginBase
 
+# Name of the file caching discovered plugin modules per plugins directory
+PLUGIN_CACHE_FILE = "plugins.json"
+
+
+def _default_cache_dir() -> Path:
+    """Return the user cache directory for healthdcat_converter."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "healthdcat_converter"
+
 
 class PluginLoader:
     """
@@ -16,15 +28,29 @@ class PluginLoader:
     which triggers the auto-registration mechanism in PluginBase.
     """
 
-    def __init__(self, plugins_package: str = "healthdcat_converter.plugins"):
+    def __init__(
+        self,
+        plugins_package: str = "healthdcat_converter.plugins",
+        cache_dir: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ):
         """
         Initialize the plugin loader.
 
         Args:
             plugins_package: Package path to the plugins directory
+            cache_dir: Directory for the discovered-modules cache
+                (default: $XDG_CACHE_HOME/healthdcat_converter)
+            use_cache: Reuse the cached module list while the plugins
+                directory is unchanged (default: True)
         """
         self.plugins_package = plugins_package
+        self.cache_file = (
+            Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+        ) / PLUGIN_CACHE_FILE
+        self.use_cache = use_cache
         self._loaded = False
+        self._instances: Dict[str, PluginBase] = {}
 
     def load_plugins(self) -> List[str]:
         """
@@ -48,13 +74,9 @@ class PluginLoader:
             else:
                 return PluginBase.list_plugins()
 
-            # Iterate through all modules in the plugins directory
-            for _, module_name, is_pkg in pkgutil.iter_modules(plugins_path):
-                # Skip __pycache__ and other special directories
-                if module_name.startswith("_"):
-                    continue
-
-                # Import the module to trigger plugin registration
+            # Import each module in the plugins directory to trigger plugin
+            # registration
+            for module_name in self._discover_modules(plugins_path):
                 full_module_name = f"{self.plugins_package}.{module_name}"
                 importlib.import_module(full_module_name)
 
@@ -65,6 +87,77 @@ class PluginLoader:
 
         return PluginBase.list_plugins()
 
+    def _discover_modules(self, plugins_path: Iterable[Any]) -> List[str]:
+        """
+        List plugin module names, using the on-disk cache when it is fresh.
+
+        The cache is keyed by the plugins directory and its modification time,
+        which changes whenever a module is added, removed or renamed.
+
+        Args:
+            plugins_path: Directories of the plugins package
+
+        Returns:
+            Module names (without the package prefix)
+        """
+        paths = [str(path) for path in plugins_path]
+        if not self.use_cache or len(paths) != 1:
+            return self._scan_modules(paths)
+
+        directory = paths[0]
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return self._scan_modules(paths)
+
+        cache = self._read_cache()
+        entry = cache.get(directory)
+        if isinstance(entry, dict) and entry.get("mtime") == mtime:
+            return list(entry.get("modules", []))
+
+        modules = self._scan_modules(paths)
+        cache[directory] = {"mtime": mtime, "modules": modules}
+        self._write_cache(cache)
+        return modules
+
+    def _scan_modules(self, paths: List[str]) -> List[str]:
+        """
+        Scan the plugins directories for modules.
+
+        Args:
+            paths: Directories of the plugins package
+
+        Returns:
+            Module names (without the package prefix)
+        """
+        return [
+            module_name
+            for _, module_name, _ in pkgutil.iter_modules(paths)
+            # Skip __pycache__ and other special directories
+            if not module_name.startswith("_")
+        ]
+
+    def _read_cache(self) -> Dict[str, Any]:
+        """Read the discovered-modules cache, returning {} if it is unusable."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _write_cache(self, cache: Dict[str, Any]) -> None:
+        """Atomically write the discovered-modules cache, ignoring I/O errors."""
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_file.unlink(missing_ok=True)
+
     def get_plugin(self, name: str) -> type:
         """
         Get a plugin by name.
@@ -79,6 +172,27 @@ class PluginLoader:
             self.load_plugins()
         return PluginBase.get_plugin(name)
 
+    def get_instance(self, name: str) -> PluginBase:
+        """
+        Get a shared instance of a plugin by name.
+
+        Instances are created on first use and reused afterwards, so repeated
+        executions don't pay the plugin's construction cost. A new instance is
+        created if the plugin name has been re-registered to another class.
+
+        Args:
+            name: Name of the plugin
+
+        Returns:
+            Plugin instance
+        """
+        plugin_class = self.get_plugin(name)
+        instance = self._instances.get(name)
+        if instance is None or type(instance) is not plugin_class:
+            instance = plugin_class()
+            self._instances[name] = instance
+        return instance
+
     def get_all_plugins(self) -> dict:
         """
         Get all loaded plugins.
@@ -1,11 +1,15 @@
 """CSV Reader plugin for reading CSV files."""
 
 import csv
-from typing import List, Dict, Any
+from itertools import islice
+from typing import Any, Dict, Iterator, List
 from pathlib import Path
 
 from ..plugin_base import PluginBase
 
+# Read buffer size used when opening CSV files (1 MiB)
+READ_BUFFER_SIZE = 1 << 20
+
 
 class CSVReaderPlugin(PluginBase):
     """Plugin to read CSV files and convert them to a list of dictionaries."""
@@ -14,22 +18,110 @@ class CSVReaderPlugin(PluginBase):
     def get_name(cls) -> str:
         return "csv_reader"
 
-    def execute(self, data: Any, **kwargs) -> List[Dict[str, Any]]:
+    def execute(self, data: Any, **kwargs) -> Any:
         """
         Read a CSV file and return its contents as a list of dictionaries.
 
         Args:
             data: Path to the CSV file (str or Path)
-            **kwargs: Additional arguments for csv.DictReader
+            **kwargs: Additional options:
+                - chunk_size: When set, return an iterator of row batches of
+                  at most this many rows instead of a single list
+                - as_arrow: Parse the file with pyarrow and return a
+                  pyarrow.Table instead of dictionaries (default: False)
+                - any other keyword is passed to csv.DictReader
 
         Returns:
-            List of dictionaries representing CSV rows
+            List of dictionaries representing CSV rows, an iterator of
+            such lists when chunk_size is given, or a pyarrow.Table when
+            as_arrow is set
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            ImportError: If as_arrow is set but pyarrow is not installed
         """
+        chunk_size = kwargs.pop("chunk_size", None)
+        as_arrow = kwargs.pop("as_arrow", False)
         file_path = Path(data)
 
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as csvfile:
+        if as_arrow:
+            return self._read_arrow(file_path)
+
+        if chunk_size is not None:
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be a positive integer")
+            return self._iter_chunks(file_path, chunk_size, **kwargs)
+
+        with open(
+            file_path, "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE
+        ) as csvfile:
             reader = csv.DictReader(csvfile, **kwargs)
             return list(reader)
+
+    def _iter_chunks(
+        self, file_path: Path, chunk_size: int, **kwargs
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily read a CSV file in batches of rows.
+
+        Args:
+            file_path: Path to the CSV file
+            chunk_size: Maximum number of rows per batch
+            **kwargs: Additional arguments for csv.DictReader
+
+        Yields:
+            Lists of dictionaries representing consecutive CSV rows
+        """
+        with open(
+            file_path, "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE
+        ) as csvfile:
+            reader = csv.DictReader(csvfile, **kwargs)
+            while True:
+                chunk = list(islice(reader, chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+    def _read_arrow(self, file_path: Path) -> Any:
+        """
+        Read a CSV file into a pyarrow.Table using the multithreaded parser.
+
+        Only empty fields become nulls and no words are read as booleans, so
+        column types match what the RDF generator infers for the same file
+        read as dictionaries (where values like "NA" or "true" are text).
+        Arrow still types each column from all of its values, not a sample.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            pyarrow.Table with one column per CSV field
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        # pyarrow is an optional dependency, only imported when used
+        try:
+            from pyarrow import csv as pacsv
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for as_arrow=True; "
+                "install it with: pip install 'healthdcat-converter[arrow]'"
+            ) from e
+
+        return pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(
+                block_size=READ_BUFFER_SIZE, use_threads=True
+            ),
+            convert_options=pacsv.ConvertOptions(
+                null_values=[""],
+                true_values=[],
+                false_values=[],
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
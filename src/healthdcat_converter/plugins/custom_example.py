@@ -12,6 +12,7 @@ The plugin will be automatically discovered and registered when the
 plugin loader runs.
 """
 
+import sys
 from typing import Any
 from ..plugin_base import PluginBase
 
@@ -33,20 +34,30 @@ class CustomTransformPlugin(PluginBase):
         Transform the data in a custom way.
 
         Args:
-            data: Input data to transform
+            data: Input data to transform (list of dictionaries or
+                pyarrow.Table)
             **kwargs: Additional transformation options
 
         Returns:
             Transformed data
         """
+        name = self.get_name()
+
+        # Columnar input: append constant columns instead of touching rows.
+        # A pyarrow.Table implies pyarrow is imported, so don't import it here
+        pa = sys.modules.get("pyarrow")
+        if pa is not None and isinstance(data, pa.Table):
+            return data.append_column(
+                "_transformed", pa.repeat(True, data.num_rows)
+            ).append_column("_plugin", pa.repeat(name, data.num_rows))
+
+        if not isinstance(data, list):
+            return data
+
         # Example transformation: add a custom field to each row
-        if isinstance(data, list):
-            transformed = []
-            for row in data:
-                if isinstance(row, dict):
-                    row["_transformed"] = True
-                    row["_plugin"] = self.get_name()
-                transformed.append(row)
-            return transformed
-
-        return data
+        return [
+            {**row, "_transformed": True, "_plugin": name}
+            if isinstance(row, dict)
+            else row
+            for row in data
+        ]
@@ -1,19 +1,215 @@
 """RDF Generator plugin for converting data to RDF format."""
 
-from typing import Any, Dict, List
-from rdflib import Graph, Namespace, URIRef, Literal
+import io
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple, Union
+from rdflib import Graph, Namespace, URIRef, Literal, plugin
 from rdflib.namespace import RDF, RDFS
+from rdflib.serializer import Serializer
 from ..plugin_base import PluginBase
 
+# Pattern used to classify numeric strings without raising exceptions; a
+# match in which no group took part is an integer
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+(\.\d*)?|(\.\d+))([eE][+-]?\d+)?")
+
+# Number of non-empty values per column that contribute to its datatype
+INFERENCE_SAMPLE_SIZE = 64
+
+# Number of distinct table schemas whose column literals are memoized
+SCHEMA_CACHE_SIZE = 128
+
+# HealthDCAT-AP namespace prefixes, in binding order
+NAMESPACES = {
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "dct": "http://purl.org/dc/terms/",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "vcard": "http://www.w3.org/2006/vcard/ns#",
+    "schema": "http://schema.org/",
+    "rdfs": str(RDFS),
+    "csvw": "http://www.w3.org/ns/csvw#",
+    "healthdcat": "https://health.ec.europa.eu/healthdcat-ap/",
+}
+
+# Fixed descriptive values of every generated dataset
+DATASET_TITLE = "Health Dataset"
+DATASET_DESCRIPTION = "Dataset converted from CSV"
+HEALTH_CATEGORY = "general"
+
+# Formats written directly instead of through an rdflib Graph
+TURTLE_FORMATS = frozenset({"turtle", "ttl"})
+NTRIPLES_FORMATS = frozenset({"nt", "nt11", "ntriples"})
+
+# Binary Jelly formats and their (prefix table size, name table size).
+# "jelly" matches the jelly-full defaults; "jelly-noprefix-sm" drops the
+# prefix table and uses a small name table for the fastest writes.
+JELLY_FORMATS = {
+    "jelly": (150, 4000),
+    "jelly-noprefix-sm": (0, 256),
+}
+
+# Prefix block written at the start of every direct Turtle document
+_TURTLE_PRELUDE = (
+    "".join(f"@prefix {prefix}: <{uri}> .\n" for prefix, uri in NAMESPACES.items())
+    + "\n"
+)
+
+# Characters not allowed inside an IRIREF; such URIs go through rdflib instead
+_IRI_UNSAFE_RE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+# Escapes for quoted string literals, shared by Turtle and N-Triples
+_LITERAL_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+_XSD_INTEGER = "<http://www.w3.org/2001/XMLSchema#integer>"
+
+# Separator between objects sharing a subject and predicate in Turtle
+_TURTLE_OBJECT_SEP = ",\n        "
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _column_literals(
+    columns: Tuple[str, ...], datatypes: Tuple[str, ...]
+) -> Tuple[Tuple[Literal, Literal], ...]:
+    """
+    Build the (name, datatype) literals of a table schema.
+
+    Memoized per schema, so repeated conversions of files with the same
+    columns (e.g. daily dumps) reuse the same Literal objects.
+
+    Args:
+        columns: Column names
+        datatypes: Datatype of each column, in the same order
+
+    Returns:
+        Tuple of (name literal, datatype literal) per column
+    """
+    return tuple(
+        (Literal(col_name), Literal(datatype))
+        for col_name, datatype in zip(columns, datatypes)
+    )
+
+
+def _derived_uri(value: str) -> URIRef:
+    """
+    Build a URIRef for a URI derived from the already validated dataset URI.
+
+    Appending path segments without unsafe characters can't change the
+    outcome of rdflib's URI check, so it is skipped for these URIs.
+    """
+    return str.__new__(URIRef, value)
+
+
+@lru_cache(maxsize=None)
+def _jelly_options(rdf_format: str) -> Any:
+    """
+    Build the pyjelly serializer options of a Jelly format, once per format.
+
+    pyjelly is an optional dependency and is only imported here.
+
+    Args:
+        rdf_format: One of JELLY_FORMATS
+
+    Returns:
+        pyjelly SerializerOptions for the format
+
+    Raises:
+        ImportError: If pyjelly is not installed
+    """
+    try:
+        from pyjelly import jelly
+        from pyjelly.options import LookupPreset, StreamParameters
+        from pyjelly.serialize.streams import SerializerOptions
+    except ImportError as e:
+        raise ImportError(
+            f"pyjelly is required for format={rdf_format!r}; "
+            "install it with: pip install 'healthdcat-converter[jelly]'"
+        ) from e
+
+    max_prefixes, max_names = JELLY_FORMATS[rdf_format]
+    return SerializerOptions(
+        logical_type=jelly.LOGICAL_STREAM_TYPE_FLAT_TRIPLES,
+        params=StreamParameters(generalized_statements=False, rdf_star=False),
+        lookup_preset=LookupPreset(max_names=max_names, max_prefixes=max_prefixes),
+    )
+
+
+def _is_arrow_table(data: Any) -> bool:
+    """
+    Return True if data is a pyarrow.Table.
+
+    A Table can only exist once pyarrow has been imported, so pyarrow is
+    looked up in sys.modules instead of being imported for the check.
+    """
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(data, pa.Table)
+
+
+def _promote(current: Optional[str], new: str) -> str:
+    """Combine two datatypes seen in the same column into the one that fits both."""
+    if current is None or current == new:
+        return new
+    elif {current, new} == {"integer", "decimal"}:
+        return "decimal"
+    return "string"
+
+
+def _ttl_escape(value: str) -> str:
+    """Escape a string for use inside a double-quoted Turtle/N-Triples literal."""
+    return value.translate(_LITERAL_ESCAPES)
+
+
+def _ttl_term(qname: str) -> str:
+    """Render a vocabulary term in Turtle, using the declared prefixes."""
+    return "a" if qname == "rdf:type" else qname
+
+
+def _ttl_literal(value: Any) -> str:
+    """Render a string or integer literal in Turtle."""
+    if isinstance(value, int):
+        return str(value)
+    return f'"{_ttl_escape(value)}"'
+
+
+@lru_cache(maxsize=None)
+def _nt_term(qname: str) -> str:
+    """Render a vocabulary term in N-Triples as a full IRI."""
+    prefix, local = qname.split(":", 1)
+    namespace = str(RDF) if prefix == "rdf" else NAMESPACES[prefix]
+    return f"<{namespace}{local}>"
+
+
+def _nt_literal(value: Any) -> str:
+    """Render a string or integer literal in N-Triples."""
+    if isinstance(value, int):
+        return f'"{value}"^^{_XSD_INTEGER}'
+    return f'"{_ttl_escape(value)}"'
+
 
 class RDFGeneratorPlugin(PluginBase):
     """
     Plugin to generate RDF metadata following HealthDCAT Application Profile.
 
     Uses rdflib for robust RDF generation and supports multiple serialization formats.
+    Turtle and N-Triples are written directly, without building an rdflib Graph.
     Implements the full HealthDCAT-AP specification: https://healthdcat-ap.github.io/
     """
 
+    # (predicate, object) pairs shared by every dataset, built once so the
+    # Graph-based path doesn't recreate the same URIRefs and Literals
+    _DATASET_PROPERTIES = (
+        (RDF.type, Namespace(NAMESPACES["dcat"]).Dataset),
+        (Namespace(NAMESPACES["dct"]).title, Literal(DATASET_TITLE)),
+        (Namespace(NAMESPACES["dct"]).description, Literal(DATASET_DESCRIPTION)),
+        (
+            Namespace(NAMESPACES["healthdcat"]).hasHealthCategory,
+            Literal(HEALTH_CATEGORY),
+        ),
+    )
+
     @classmethod
     def get_name(cls) -> str:
         return "rdf_generator"
@@ -23,65 +219,362 @@ class RDFGeneratorPlugin(PluginBase):
         self.graph = Graph()
 
         # Define namespaces
-        self.DCAT = Namespace("http://www.w3.org/ns/dcat#")
-        self.DCT = Namespace("http://purl.org/dc/terms/")
-        self.FOAF = Namespace("http://xmlns.com/foaf/0.1/")
-        self.VCARD = Namespace("http://www.w3.org/2006/vcard/ns#")
-        self.SCHEMA = Namespace("http://schema.org/")
-        self.CSVW = Namespace("http://www.w3.org/ns/csvw#")
-        self.HEALTHDCAT = Namespace("https://health.ec.europa.eu/healthdcat-ap/")
+        self.DCAT = Namespace(NAMESPACES["dcat"])
+        self.DCT = Namespace(NAMESPACES["dct"])
+        self.FOAF = Namespace(NAMESPACES["foaf"])
+        self.VCARD = Namespace(NAMESPACES["vcard"])
+        self.SCHEMA = Namespace(NAMESPACES["schema"])
+        self.CSVW = Namespace(NAMESPACES["csvw"])
+        self.HEALTHDCAT = Namespace(NAMESPACES["healthdcat"])
+
+        # Prefix table bound into every graph built in execute(). Each graph
+        # gets its own NamespaceManager, since rdflib's keeps every IRI it
+        # has shortened and sharing one would grow it without bound
+        self._namespace_bindings = [
+            (prefix, Namespace(uri)) for prefix, uri in NAMESPACES.items()
+        ]
 
         # Bind namespaces to graph
-        self.graph.bind("dcat", self.DCAT)
-        self.graph.bind("dct", self.DCT)
-        self.graph.bind("foaf", self.FOAF)
-        self.graph.bind("vcard", self.VCARD)
-        self.graph.bind("schema", self.SCHEMA)
-        self.graph.bind("rdfs", RDFS)
-        self.graph.bind("csvw", self.CSVW)
-        self.graph.bind("healthdcat", self.HEALTHDCAT)
-
-    def execute(self, data: Any, **kwargs) -> str:
+        for prefix, namespace in self._namespace_bindings:
+            self.graph.bind(prefix, namespace)
+
+        # Terms used for every column; each Namespace attribute access
+        # builds and validates a new URIRef, so look them up only once
+        self._RDF_type = RDF.type
+        self._RDFS_label = RDFS.label
+        self._SCHEMA_numberOfItems = self.SCHEMA.numberOfItems
+        self._CSVW_tableSchema = self.CSVW.tableSchema
+        self._CSVW_TableSchema = self.CSVW.TableSchema
+        self._CSVW_column = self.CSVW.column
+        self._CSVW_Column = self.CSVW.Column
+        self._CSVW_name = self.CSVW.name
+        self._CSVW_title = self.CSVW.title
+        self._CSVW_datatype = self.CSVW.datatype
+
+    def execute(self, data: Any, **kwargs) -> Any:
         """
         Convert data to RDF format following HealthDCAT-AP.
 
         Args:
-            data: Data to convert (typically a list of dictionaries)
+            data: Data to convert (typically a list of dictionaries, or a
+                pyarrow.Table as returned by csv_reader with as_arrow=True)
             **kwargs: Additional options:
-                - format: RDF serialization format (default: 'turtle')
+                - format: RDF serialization format (default: 'turtle'), or
+                  one of the binary Jelly formats 'jelly' and
+                  'jelly-noprefix-sm' (requires pyjelly)
                 - dataset_uri: Base URI for the dataset
+                - num_rows: Number of records to report (default: len(data)),
+                  used when data is only a sample of a streamed dataset
+                - sample_size: Number of non-empty values per column used to
+                  infer its datatype (default: 64). Raise it for columns
+                  whose first values aren't representative, e.g. integers
+                  with the occasional decimal or text further down
+                - out: Text stream or file path to write the RDF to
+                  instead of returning it (e.g. sys.stdout or 'out.nt').
+                  Turtle and N-Triples are written as they are generated,
+                  without holding the document in memory. Jelly output
+                  goes to the stream's binary buffer, or to out itself
+                  when it is a binary stream
 
         Returns:
-            RDF data as a string in the specified format
+            RDF data as a string in the specified format (bytes for Jelly),
+            or an empty string when out is given
+
+        Raises:
+            ImportError: If a Jelly format is requested but pyjelly is not
+                installed
+            ValueError: If sample_size is less than 1
         """
         rdf_format = kwargs.get("format", "turtle")
         dataset_uri = kwargs.get("dataset_uri", "http://example.org/dataset")
-
-        # Create a fresh graph for this execution
+        out = kwargs.get("out")
+        sample_size = kwargs.get("sample_size")
+        if sample_size is None:
+            sample_size = INFERENCE_SAMPLE_SIZE
+        elif sample_size < 1:
+            raise ValueError("sample_size must be a positive integer")
+
+        if isinstance(out, (str, Path)):
+            # Fail on an unusable format before truncating the output file,
+            # then open it and write to it as a stream
+            self._check_format(rdf_format)
+            if rdf_format in JELLY_FORMATS:
+                with open(out, "wb") as stream:
+                    return self.execute(data, **{**kwargs, "out": stream})
+            with open(out, "w", encoding="utf-8", newline="") as stream:
+                return self.execute(data, **{**kwargs, "out": stream})
+
+        record_count = self._record_count(data, kwargs.get("num_rows"))
+        schema = self._table_schema(data, sample_size)
+
+        # Turtle and N-Triples have a fixed shape here, so write them
+        # directly instead of building and serializing a Graph
+        direct = (
+            rdf_format in TURTLE_FORMATS or rdf_format in NTRIPLES_FORMATS
+        ) and not _IRI_UNSAFE_RE.search(dataset_uri)
+        if direct and schema is not None:
+            # Column names that aren't strings (csv.DictReader files extra
+            # fields under None) become rdflib Literals, so use the Graph
+            direct = all(isinstance(col_name, str) for col_name in schema[0])
+        if direct:
+            stream = out if out is not None else io.StringIO()
+            self._write_direct(
+                stream,
+                rdf_format in NTRIPLES_FORMATS,
+                dataset_uri,
+                record_count,
+                schema,
+            )
+            return "" if out is not None else stream.getvalue()
+
+        # Create a fresh graph for this execution and bind the namespaces
         graph = Graph()
-
-        # Bind namespaces
-        graph.bind("dcat", self.DCAT)
-        graph.bind("dct", self.DCT)
-        graph.bind("foaf", self.FOAF)
-        graph.bind("vcard", self.VCARD)
-        graph.bind("schema", self.SCHEMA)
-        graph.bind("rdfs", RDFS)
-        graph.bind("csvw", self.CSVW)
-        graph.bind("healthdcat", self.HEALTHDCAT)
+        for prefix, namespace in self._namespace_bindings:
+            graph.bind(prefix, namespace)
 
         # Add dataset metadata
-        self._add_dataset_metadata(graph, dataset_uri, data)
+        self._add_dataset_metadata(
+            graph, dataset_uri, record_count, has_schema=schema is not None
+        )
 
         # Add table schema with variables
-        if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            self._add_table_schema(graph, dataset_uri, data)
+        if schema is not None:
+            self._add_table_schema(graph, dataset_uri, *schema)
 
         # Serialize to requested format
+        if rdf_format in JELLY_FORMATS:
+            return self._write_jelly(graph, out, rdf_format)
+        if out is not None:
+            self._write(graph, out, rdf_format)
+            return ""
         return graph.serialize(format=rdf_format)
 
+    def _record_count(self, data: Any, num_rows: Optional[int]) -> Optional[int]:
+        """
+        Get the number of records to report for the dataset.
+
+        Args:
+            data: Dataset content
+            num_rows: Number of records, if different from the size of data
+
+        Returns:
+            Number of records, or None if data has no records
+        """
+        if _is_arrow_table(data):
+            size = data.num_rows
+        elif isinstance(data, list):
+            size = len(data)
+        else:
+            return None
+
+        if size == 0:
+            return None
+        return num_rows if num_rows is not None else size
+
+    def _table_schema(
+        self, data: Any, sample_size: int = INFERENCE_SAMPLE_SIZE
+    ) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """
+        Get the column names and inferred datatypes of tabular data.
+
+        Args:
+            data: Dataset content (list of dictionaries or pyarrow.Table)
+            sample_size: Number of non-empty values sampled per column
+
+        Returns:
+            Tuple of (column names, datatypes), or None if data is not tabular
+        """
+        if _is_arrow_table(data):
+            if data.num_rows == 0:
+                return None
+            # Columnar input: names and types come straight from the schema
+            columns = tuple(data.column_names)
+            datatypes = tuple(self._arrow_datatype(field.type) for field in data.schema)
+            return columns, datatypes
+
+        if not (isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict)):
+            return None
+
+        columns = tuple(data[0].keys())
+        inferred = self._infer_datatypes(data, columns, sample_size)
+        return columns, tuple(inferred[col_name] for col_name in columns)
+
+    def _write_direct(
+        self,
+        out: TextIO,
+        ntriples: bool,
+        dataset_uri: str,
+        record_count: Optional[int],
+        schema: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]],
+    ) -> None:
+        """
+        Write the dataset description as Turtle or N-Triples without rdflib.
+
+        Produces the same triples as the Graph-based path.
+
+        Args:
+            out: Text stream to write to
+            ntriples: Write N-Triples instead of Turtle
+            dataset_uri: URI for the dataset
+            record_count: Number of records, or None if there are none
+            schema: Column names and datatypes, or None if data is not tabular
+        """
+        if ntriples:
+            term, literal = _nt_term, _nt_literal
+        else:
+            term, literal = _ttl_term, _ttl_literal
+            out.write(_TURTLE_PRELUDE)
+
+        def write(subject: str, properties: List[Tuple[str, List[str]]]) -> None:
+            if ntriples:
+                out.write(
+                    "".join(
+                        f"{subject} {predicate} {obj} .\n"
+                        for predicate, objects in properties
+                        for obj in objects
+                    )
+                )
+            else:
+                body = " ;\n    ".join(
+                    f"{predicate} {_TURTLE_OBJECT_SEP.join(objects)}"
+                    for predicate, objects in properties
+                )
+                out.write(f"{subject} {body} .\n\n")
+
+        schema_uri = f"{dataset_uri}/schema"
+
+        # Dataset metadata
+        properties = [
+            (term("rdf:type"), [term("dcat:Dataset")]),
+            (term("dct:title"), [literal(DATASET_TITLE)]),
+            (term("dct:description"), [literal(DATASET_DESCRIPTION)]),
+            (term("healthdcat:hasHealthCategory"), [literal(HEALTH_CATEGORY)]),
+        ]
+        if record_count is not None:
+            properties.append((term("schema:numberOfItems"), [literal(record_count)]))
+        if schema is not None:
+            properties.append((term("csvw:tableSchema"), [f"<{schema_uri}>"]))
+        write(f"<{dataset_uri}>", properties)
+
+        if schema is None:
+            return
+
+        # Table schema and column definitions
+        columns, datatypes = schema
+        column_uris = [f"<{schema_uri}/column/{idx}>" for idx in range(len(columns))]
+        write(
+            f"<{schema_uri}>",
+            [
+                (term("rdf:type"), [term("csvw:TableSchema")]),
+                (term("csvw:column"), column_uris),
+            ],
+        )
+        for col_name, datatype, col_uri in zip(columns, datatypes, column_uris):
+            name = literal(col_name)
+            write(
+                col_uri,
+                [
+                    (term("rdf:type"), [term("csvw:Column")]),
+                    (term("csvw:name"), [name]),
+                    (term("csvw:title"), [name]),
+                    (term("rdfs:label"), [name]),
+                    (term("csvw:datatype"), [literal(datatype)]),
+                ],
+            )
+
+    def _write(self, graph: Graph, out: TextIO, rdf_format: str) -> None:
+        """
+        Serialize the graph into a text stream.
+
+        Streams with an underlying binary buffer (files, sys.stdout) are
+        written to directly, without building the document as a string.
+
+        Args:
+            graph: RDF graph to serialize
+            out: Text stream to write to
+            rdf_format: RDF serialization format
+        """
+        buffer = getattr(out, "buffer", None)
+        if buffer is None:
+            out.write(graph.serialize(format=rdf_format))
+            return
+
+        # Flush pending text before writing to the binary buffer underneath
+        out.flush()
+        graph.serialize(
+            destination=buffer,
+            format=rdf_format,
+            encoding=getattr(out, "encoding", None) or "utf-8",
+        )
+        buffer.flush()
+
+    def _check_format(self, rdf_format: str) -> None:
+        """
+        Check that data can be serialized in the given format.
+
+        Args:
+            rdf_format: RDF serialization format
+
+        Raises:
+            ImportError: If a Jelly format is requested but pyjelly is not
+                installed
+            rdflib.plugin.PluginException: If rdflib has no serializer for
+                the format
+        """
+        if rdf_format in TURTLE_FORMATS or rdf_format in NTRIPLES_FORMATS:
+            return
+        elif rdf_format in JELLY_FORMATS:
+            _jelly_options(rdf_format)
+        else:
+            plugin.get(rdf_format, Serializer)
+
+    def _write_jelly(
+        self, graph: Graph, out: Optional[Any], rdf_format: str
+    ) -> Union[str, bytes]:
+        """
+        Serialize the graph as a Jelly stream.
+
+        Args:
+            graph: RDF graph to serialize
+            out: Stream to write to (text streams are written through their
+                binary buffer), or None to return the document
+            rdf_format: One of JELLY_FORMATS
+
+        Returns:
+            The Jelly document, or an empty string when out is given
+
+        Raises:
+            ImportError: If pyjelly is not installed
+            TypeError: If out is a text stream without a binary buffer
+        """
+        options = _jelly_options(rdf_format)
+
+        if out is None:
+            buffer = io.BytesIO()
+            graph.serialize(destination=buffer, format="jelly", options=options)
+            return buffer.getvalue()
+
+        buffer = getattr(out, "buffer", None)
+        if buffer is not None:
+            # Flush pending text before writing to the binary buffer underneath
+            out.flush()
+        elif isinstance(out, io.TextIOBase):
+            raise TypeError(
+                f"format={rdf_format!r} is binary; out must be a binary stream "
+                "or a text stream with an underlying buffer (not io.StringIO)"
+            )
+        else:
+            buffer = out
+        graph.serialize(destination=buffer, format="jelly", options=options)
+        buffer.flush()
+        return ""
+
     def _add_dataset_metadata(
-        self, graph: Graph, dataset_uri: str, data: List[Dict]
+        self,
+        graph: Graph,
+        dataset_uri: str,
+        record_count: Optional[int],
+        has_schema: bool,
     ) -> None:
         """
         Add dataset metadata to the RDF graph.
@@ -89,29 +582,30 @@ class RDFGeneratorPlugin(PluginBase):
         Args:
             graph: RDF graph to add triples to
             dataset_uri: URI for the dataset
-            data: Dataset content
+            record_count: Number of records, or None if there are none
+            has_schema: Whether to link the dataset to its table schema
         """
         dataset = URIRef(dataset_uri)
 
         # Add dataset type and basic properties
-        graph.add((dataset, RDF.type, self.DCAT.Dataset))
-        graph.add((dataset, self.DCT.title, Literal("Health Dataset")))
-        graph.add(
-            (dataset, self.DCT.description, Literal("Dataset converted from CSV"))
-        )
-        graph.add((dataset, self.HEALTHDCAT.hasHealthCategory, Literal("general")))
+        for predicate, obj in self._DATASET_PROPERTIES:
+            graph.add((dataset, predicate, obj))
 
-        if isinstance(data, list) and len(data) > 0:
-            # Add number of records
-            graph.add((dataset, self.SCHEMA.numberOfItems, Literal(len(data))))
+        # Add number of records
+        if record_count is not None:
+            graph.add((dataset, self._SCHEMA_numberOfItems, Literal(record_count)))
 
-            # Link to table schema
-            if isinstance(data[0], dict):
-                schema_uri = URIRef(f"{dataset_uri}/schema")
-                graph.add((dataset, self.CSVW.tableSchema, schema_uri))
+        # Link to table schema
+        if has_schema:
+            schema_uri = _derived_uri(f"{dataset_uri}/schema")
+            graph.add((dataset, self._CSVW_tableSchema, schema_uri))
 
     def _add_table_schema(
-        self, graph: Graph, dataset_uri: str, data: List[Dict]
+        self,
+        graph: Graph,
+        dataset_uri: str,
+        columns: Tuple[str, ...],
+        datatypes: Tuple[str, ...],
     ) -> None:
         """
         Add table schema with column/variable definitions using CSVW.
@@ -119,68 +613,124 @@ class RDFGeneratorPlugin(PluginBase):
         Args:
             graph: RDF graph to add triples to
             dataset_uri: URI for the dataset
-            data: Dataset content with column names
+            columns: Column names
+            datatypes: Datatype of each column, in the same order
         """
-        schema_uri = URIRef(f"{dataset_uri}/schema")
+        schema_uri = _derived_uri(f"{dataset_uri}/schema")
 
         # Add table schema type
-        graph.add((schema_uri, RDF.type, self.CSVW.TableSchema))
+        graph.add((schema_uri, self._RDF_type, self._CSVW_TableSchema))
 
-        columns = list(data[0].keys())
-        column_uris = [
-            URIRef(f"{dataset_uri}/schema/column/{idx}") for idx in range(len(columns))
-        ]
+        base_col = f"{schema_uri}/column/"
+        column_uris = [_derived_uri(base_col + str(idx)) for idx in range(len(columns))]
 
         # Link columns to schema
         for col_uri in column_uris:
-            graph.add((schema_uri, self.CSVW.column, col_uri))
+            graph.add((schema_uri, self._CSVW_column, col_uri))
 
-        # Define each column
-        for idx, col_name in enumerate(columns):
-            col_uri = column_uris[idx]
+        literals = _column_literals(columns, datatypes)
 
+        # Define each column
+        for (name, datatype), col_uri in zip(literals, column_uris):
             # Add column type and properties
-            graph.add((col_uri, RDF.type, self.CSVW.Column))
-            graph.add((col_uri, self.CSVW.name, Literal(col_name)))
-            graph.add((col_uri, self.CSVW.title, Literal(col_name)))
-            graph.add((col_uri, RDFS.label, Literal(col_name)))
+            graph.add((col_uri, self._RDF_type, self._CSVW_Column))
+            graph.add((col_uri, self._CSVW_name, name))
+            graph.add((col_uri, self._CSVW_title, name))
+            graph.add((col_uri, self._RDFS_label, name))
+
+            # Add inferred datatype
+            graph.add((col_uri, self._CSVW_datatype, datatype))
+
+    def _infer_datatypes(
+        self,
+        data: List[Dict],
+        columns: Sequence[str],
+        sample_size: int = INFERENCE_SAMPLE_SIZE,
+    ) -> Dict[str, str]:
+        """
+        Infer datatypes for all columns in a single pass over the rows.
+
+        The first sample_size non-empty values of each column contribute to
+        its type, promoting integer to decimal and anything mixed to string.
+        A column stops being scanned once its sample is complete or it is a
+        string, and the scan ends when no column is left.
+
+        Args:
+            data: Dataset content
+            columns: Names of the columns to infer
+            sample_size: Number of non-empty values sampled per column
 
-            # Infer and add datatype
-            datatype = self._infer_datatype(data, col_name)
-            graph.add((col_uri, self.CSVW.datatype, Literal(datatype)))
+        Returns:
+            Dictionary of column name to datatype string (xsd types)
+        """
+        datatypes: Dict[str, Optional[str]] = dict.fromkeys(columns)
+        remaining = dict.fromkeys(columns, sample_size)
+        pending = list(columns)
 
-    def _infer_datatype(self, data: List[Dict], column_name: str) -> str:
+        for row in data:
+            finished = False
+            for col_name in pending:
+                value = row.get(col_name)
+                if value is not None and value != "":
+                    datatype = _promote(datatypes[col_name], self._classify(value))
+                    datatypes[col_name] = datatype
+                    remaining[col_name] -= 1
+                    if datatype == "string" or not remaining[col_name]:
+                        finished = True
+            if finished:
+                pending = [
+                    c for c in pending if datatypes[c] != "string" and remaining[c]
+                ]
+                if not pending:
+                    break
+
+        return {col_name: datatypes[col_name] or "string" for col_name in columns}
+
+    def _classify(self, value: Any) -> str:
         """
-        Infer datatype for a column based on its values.
+        Classify a single value into a datatype.
 
         Args:
-            data: Dataset content
-            column_name: Name of the column
+            value: Value to classify (None means no value was found)
 
         Returns:
             Datatype string (xsd types)
         """
-        for row in data:
-            value = row.get(column_name)
-            if value is not None and value != "":
-                # Try to infer type
-                if isinstance(value, bool):
-                    return "boolean"
-                elif isinstance(value, int):
-                    return "integer"
-                elif isinstance(value, float):
-                    return "decimal"
-                else:
-                    # Try to parse string as number
-                    str_value = str(value).strip()
-                    try:
-                        int(str_value)
-                        return "integer"
-                    except ValueError:
-                        try:
-                            float(str_value)
-                            return "decimal"
-                        except ValueError:
-                            return "string"
-
-        return "string"  # Default to string
+        if value is None:
+            return "string"  # Default to string
+        elif isinstance(value, bool):
+            return "boolean"
+        elif isinstance(value, int):
+            return "integer"
+        elif isinstance(value, float):
+            return "decimal"
+
+        # Check whether the string looks like a number, with a single scan
+        # of the string in the common cases
+        str_value = str(value).strip()
+        if str_value.isdecimal():
+            return "integer"
+        match = _NUMBER_RE.fullmatch(str_value)
+        if match is None:
+            return "string"
+        return "integer" if match.lastindex is None else "decimal"
+
+    def _arrow_datatype(self, arrow_type: Any) -> str:
+        """
+        Map a pyarrow column type to the datatype names used by _classify.
+
+        Args:
+            arrow_type: pyarrow.DataType of the column
+
+        Returns:
+            Datatype string (xsd types)
+        """
+        import pyarrow as pa
+
+        if pa.types.is_boolean(arrow_type):
+            return "boolean"
+        elif pa.types.is_integer(arrow_type):
+            return "integer"
+        elif pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+            return "decimal"
+        return "string"
@@ -20,6 +20,8 @@ class ValidatorPlugin(PluginBase):
             **kwargs: Validation options:
                 - required_fields: List of required field names
                 - allow_empty: Allow empty values (default: True)
+                - row_offset: Index of the first row, used in error messages
+                  when validating a chunk of a larger dataset (default: 0)
 
         Returns:
             Dictionary with validation results:
@@ -29,6 +31,7 @@ class ValidatorPlugin(PluginBase):
         """
         required_fields = kwargs.get("required_fields", [])
         allow_empty = kwargs.get("allow_empty", True)
+        row_offset = kwargs.get("row_offset", 0)
 
         result = {"valid": True, "errors": [], "warnings": []}
 
@@ -42,23 +45,22 @@ class ValidatorPlugin(PluginBase):
             return result
 
         # Check required fields
-        for idx, row in enumerate(data):
+        errors = result["errors"]
+        for idx, row in enumerate(data, start=row_offset):
             if not isinstance(row, dict):
-                result["valid"] = False
-                result["errors"].append(f"Row {idx} is not a dictionary")
+                errors.append(f"Row {idx} is not a dictionary")
                 continue
 
             # Check for required fields
             for field in required_fields:
                 if field not in row:
-                    result["valid"] = False
-                    result["errors"].append(
-                        f"Row {idx} missing required field: {field}"
-                    )
+                    errors.append(f"Row {idx} missing required field: {field}")
                 elif not allow_empty and not row[field]:
-                    result["valid"] = False
-                    result["errors"].append(
+                    errors.append(
                         f"Row {idx} has empty value for required field: {field}"
                     )
 
+        if errors:
+            result["valid"] = False
+
         return result
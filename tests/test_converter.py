@@ -1,8 +1,15 @@
 """Unit tests for the CSV to RDF converter."""
 
+import itertools
+import threading
 import pytest
 from pathlib import Path
+from rdflib import Graph, Namespace
 from healthdcat_converter import CSVtoRDFConverter
+from healthdcat_converter.converter import _prefetch
+
+CSVW = Namespace("http://www.w3.org/ns/csvw#")
+SCHEMA = Namespace("http://schema.org/")
 
 
 def test_converter_initialization():
@@ -65,3 +72,162 @@ def test_converter_integration_with_sample_csv():
     assert rdf_output is not None
     assert len(rdf_output) > 0
     assert "@prefix" in rdf_output
+
+
+def test_converter_streaming_multiple_batches(tmp_path):
+    """Test chunked conversion over several batches of consistently typed rows."""
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text(
+        "id,name\n" + "".join(f"{i},n{i}\n" for i in range(5)), encoding="utf-8"
+    )
+    converter = CSVtoRDFConverter(str(csv_path))
+    chunks = list(converter.get_plugin("csv_reader")().execute(csv_path, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    full_output = converter.convert(dataset_uri="http://example.org/dataset/rows")
+    streamed_output = converter.convert(
+        dataset_uri="http://example.org/dataset/rows", chunk_size=2
+    )
+
+    # The record count covers every batch, not just the first one
+    assert streamed_output == full_output
+    graph = Graph().parse(data=streamed_output, format="turtle")
+    counts = [str(count) for count in graph.objects(predicate=SCHEMA.numberOfItems)]
+    assert counts == ["5"]
+    assert converter.data is None
+
+
+def test_converter_streaming_reports_row_numbers_across_batches(tmp_path):
+    """Test validation errors in later batches use row numbers of the file."""
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("id,name\n0,a\n1,b\n2,c\n3,\n4,e\n", encoding="utf-8")
+    converter = CSVtoRDFConverter(str(csv_path))
+
+    with pytest.raises(ValueError, match="Row 3 has empty value"):
+        converter.convert(required_fields=["name"], allow_empty=False, chunk_size=2)
+
+
+def test_converter_streaming_infers_datatypes_from_first_batch(tmp_path):
+    """Test chunked conversion infers datatypes from the first batch only."""
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("val\n2\nx\n", encoding="utf-8")
+    converter = CSVtoRDFConverter(str(csv_path))
+
+    def datatypes(rdf_output):
+        graph = Graph().parse(data=rdf_output, format="turtle")
+        return {str(datatype) for datatype in graph.objects(predicate=CSVW.datatype)}
+
+    # Later rows don't change the type inferred from the first batch
+    assert datatypes(converter.convert(chunk_size=1)) == {"integer"}
+    assert datatypes(converter.convert()) == {"string"}
+
+
+def test_converter_handles_ragged_csv(tmp_path):
+    """Test extra fields, which csv.DictReader keys by None, still convert."""
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text("a,b\n1,2,3\n", encoding="utf-8")
+    converter = CSVtoRDFConverter(str(csv_path))
+
+    for rdf_format in ["turtle", "nt"]:
+        rdf_output = converter.convert(format=rdf_format)
+        graph = Graph().parse(data=rdf_output, format=rdf_format)
+        names = {str(name) for name in graph.objects(predicate=CSVW.name)}
+        assert names == {"a", "b", "None"}
+
+
+def test_converter_forwards_sample_size(tmp_path):
+    """Test convert() passes sample_size on to datatype inference."""
+    csv_path = tmp_path / "late_text.csv"
+    csv_path.write_text("n\n" + "1\n" * 100 + "x\n", encoding="utf-8")
+    converter = CSVtoRDFConverter(str(csv_path))
+
+    assert '"integer"' in converter.convert()
+    assert '"string"' in converter.convert(sample_size=1000)
+    with pytest.raises(ValueError, match="sample_size"):
+        converter.convert(sample_size=0)
+
+
+def test_converter_writes_to_file_path(tmp_path):
+    """Test that conversion streams the RDF to a file path when out is one."""
+    sample_csv_path = Path(__file__).parent.parent / "data" / "sample.csv"
+    converter = CSVtoRDFConverter(str(sample_csv_path))
+    expected = converter.convert(format="nt")
+
+    output_path = tmp_path / "sample.nt"
+    assert converter.convert(format="nt", out=output_path) == ""
+    assert output_path.read_text(encoding="utf-8") == expected
+
+
+def test_prefetch_preserves_order_and_errors():
+    """Test the background reader yields items in order and re-raises errors."""
+    assert list(_prefetch(range(10), maxsize=2)) == list(range(10))
+
+    def failing():
+        yield 1
+        raise RuntimeError("read failed")
+
+    with pytest.raises(RuntimeError, match="read failed"):
+        list(_prefetch(failing()))
+
+
+def test_prefetch_stops_producer_when_consumer_exits():
+    """Test closing the iterator early stops and joins the producer thread."""
+    threads = set(threading.enumerate())
+    produced = []
+
+    def endless():
+        for i in itertools.count():
+            produced.append(i)
+            yield i
+
+    items = _prefetch(endless(), maxsize=2)
+    assert [next(items) for _ in range(3)] == [0, 1, 2]
+    items.close()
+
+    assert set(threading.enumerate()) == threads
+    assert len(produced) <= 3 + 2 + 1
+
+
+def test_converter_streaming_propagates_reader_errors(tmp_path, monkeypatch):
+    """Test a reader error partway through streaming reaches the caller."""
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text("id\n1\n", encoding="utf-8")
+    converter = CSVtoRDFConverter(str(csv_path))
+    validated = []
+
+    def failing_chunks(data, **kwargs):
+        yield [{"id": "1"}]
+        yield [{"id": "2"}]
+        raise OSError("disk read failed")
+
+    def record_chunk(data, **kwargs):
+        validated.append(kwargs["row_offset"])
+        return {"valid": True, "errors": [], "warnings": []}
+
+    csv_reader = converter.plugin_loader.get_instance("csv_reader")
+    validator = converter.plugin_loader.get_instance("validator")
+    monkeypatch.setattr(csv_reader, "execute", failing_chunks)
+    monkeypatch.setattr(validator, "execute", record_chunk)
+    threads = set(threading.enumerate())
+
+    with pytest.raises(OSError, match="disk read failed"):
+        converter.convert(chunk_size=1)
+
+    assert validated == [0, 1]
+    assert set(threading.enumerate()) == threads
+
+
+def test_convert_many_matches_convert(tmp_path):
+    """Test parallel conversion of several files matches converting each one."""
+    sample_csv_path = Path(__file__).parent.parent / "data" / "sample.csv"
+    other_csv_path = tmp_path / "other.csv"
+    other_csv_path.write_text("id,score\n1,0.5\n2,1.5\n", encoding="utf-8")
+    paths = [sample_csv_path, other_csv_path]
+
+    outputs = CSVtoRDFConverter.convert_many(paths, workers=2, format="nt")
+
+    assert outputs == [
+        CSVtoRDFConverter(str(path)).convert(format="nt") for path in paths
+    ]
+    with pytest.raises(ValueError):
+        CSVtoRDFConverter.convert_many(paths, out=None)
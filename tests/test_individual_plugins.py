@@ -1,5 +1,17 @@
 """Unit tests for individual plugins."""
 
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib.plugin import PluginException
+
+from healthdcat_converter.plugins.csv_reader import CSVReaderPlugin
 from healthdcat_converter.plugins.validator import ValidatorPlugin
 from healthdcat_converter.plugins.rdf_generator import RDFGeneratorPlugin
 
@@ -31,6 +43,20 @@ def test_validator_with_missing_field():
     assert len(result["errors"]) > 0
 
 
+def test_validator_reports_fields_in_required_order():
+    """Test missing and empty field errors follow the required_fields order."""
+    validator = ValidatorPlugin()
+
+    data = [{"b": "", "c": "ok"}]
+    result = validator.execute(data, required_fields=["a", "b", "c"], allow_empty=False)
+
+    assert result["valid"] is False
+    assert result["errors"] == [
+        "Row 0 missing required field: a",
+        "Row 0 has empty value for required field: b",
+    ]
+
+
 def test_validator_with_empty_data():
     """Test validator handles empty dataset."""
     validator = ValidatorPlugin()
@@ -41,6 +67,56 @@ def test_validator_with_empty_data():
     assert len(result["warnings"]) > 0
 
 
+def test_validator_row_offset():
+    """Test validator reports row numbers relative to row_offset."""
+    validator = ValidatorPlugin()
+
+    result = validator.execute([{"age": 25}], required_fields=["name"], row_offset=10)
+
+    assert result["errors"] == ["Row 10 missing required field: name"]
+
+
+def test_csv_reader_chunks():
+    """Test CSV reader yields row batches when chunk_size is given."""
+    reader = CSVReaderPlugin()
+    sample_csv_path = Path(__file__).parent.parent / "data" / "sample.csv"
+
+    rows = reader.execute(sample_csv_path)
+    chunks = list(reader.execute(sample_csv_path, chunk_size=2))
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert [row for chunk in chunks for row in chunk] == rows
+
+
+def test_rdf_generator_arrow_table_matches_rows():
+    """Test RDF generator gives the same output for Arrow and dict input."""
+    pytest.importorskip("pyarrow")
+    reader = CSVReaderPlugin()
+    generator = RDFGeneratorPlugin()
+    sample_csv_path = Path(__file__).parent.parent / "data" / "sample.csv"
+
+    table = reader.execute(sample_csv_path, as_arrow=True)
+    rows = reader.execute(sample_csv_path)
+
+    assert table.num_rows == len(rows)
+    assert generator.execute(table) == generator.execute(rows)
+
+
+def test_rdf_generator_arrow_datatypes_match_rows(tmp_path):
+    """Test Arrow parsing doesn't read booleans or null markers like "NA"."""
+    pytest.importorskip("pyarrow")
+    reader = CSVReaderPlugin()
+    generator = RDFGeneratorPlugin()
+    csv_path = tmp_path / "flags.csv"
+    csv_path.write_text("flag,n,e\ntrue,1,\nfalse,NA,3\n", encoding="utf-8")
+
+    table_schema = generator._table_schema(reader.execute(csv_path, as_arrow=True))
+    rows_schema = generator._table_schema(reader.execute(csv_path))
+
+    assert table_schema == rows_schema
+    assert rows_schema == (("flag", "n", "e"), ("string", "string", "integer"))
+
+
 def test_rdf_generator_basic():
     """Test RDF generator produces output."""
     generator = RDFGeneratorPlugin()
@@ -54,6 +130,137 @@ def test_rdf_generator_basic():
     assert "@prefix" in rdf_output
 
 
+def test_rdf_generator_infers_column_datatypes():
+    """Test datatype inference skips empty values and classifies columns."""
+    generator = RDFGeneratorPlugin()
+
+    data = [
+        {"id": "1", "score": "", "name": "Alice", "empty": ""},
+        {"id": "2", "score": "3.5", "name": "Bob", "empty": None},
+    ]
+
+    assert generator._infer_datatypes(data, list(data[0].keys())) == {
+        "id": "integer",
+        "score": "decimal",
+        "name": "string",
+        "empty": "string",
+    }
+
+
+def test_rdf_generator_promotes_datatypes_within_sample():
+    """Test mixed values in the sample promote the column datatype."""
+    generator = RDFGeneratorPlugin()
+
+    data = [{"n": "1", "m": "1", "late": ""}, {"n": "2.5", "m": "x", "late": ""}]
+    data += [{"n": "abc", "m": "2", "late": "7"}]
+
+    assert generator._infer_datatypes(data, ["n", "m", "late"], sample_size=2) == {
+        "n": "decimal",
+        "m": "string",
+        "late": "integer",
+    }
+
+
+def test_rdf_generator_samples_non_empty_values():
+    """Test the inference sample counts non-empty values, not rows."""
+    generator = RDFGeneratorPlugin()
+
+    data = [{"n": ""}] * 5 + [{"n": "1"}, {"n": "2"}, {"n": "x"}]
+
+    assert generator._infer_datatypes(data, ["n"], sample_size=2) == {"n": "integer"}
+    assert generator._infer_datatypes(data, ["n"], sample_size=3) == {"n": "string"}
+    assert '"string"' in generator.execute(data, sample_size=3)
+
+
+def test_rdf_generator_classifies_numeric_strings():
+    """Test numeric string classification without int()/float() parsing."""
+    generator = RDFGeneratorPlugin()
+
+    assert generator._classify(" -42 ") == "integer"
+    assert generator._classify("+3.") == "decimal"
+    assert generator._classify("1.5e-3") == "decimal"
+    assert generator._classify("2025-01-10") == "string"
+    assert generator._classify("007") == "integer"
+    assert generator._classify(".5E+2") == "decimal"
+    assert generator._classify("+") == "string"
+    assert generator._classify("nan") == "string"
+
+
+def test_rdf_generator_writes_to_stream(tmp_path):
+    """Test RDF generator writes to a text stream instead of returning."""
+    generator = RDFGeneratorPlugin()
+    data = [{"name": "Test", "value": "123"}]
+    expected = generator.execute(data)
+
+    output_path = tmp_path / "out.ttl"
+    with open(output_path, "w", encoding="utf-8") as out:
+        assert generator.execute(data, out=out) == ""
+
+    assert output_path.read_text(encoding="utf-8") == expected
+
+
+def test_rdf_generator_keeps_output_file_on_unknown_format(tmp_path):
+    """Test an unknown format fails before the output file is truncated."""
+    generator = RDFGeneratorPlugin()
+    output_path = tmp_path / "existing.ttl"
+    output_path.write_text("keep me", encoding="utf-8")
+
+    with pytest.raises(PluginException):
+        generator.execute([{"a": "1"}], format="bogus", out=output_path)
+
+    assert output_path.read_text(encoding="utf-8") == "keep me"
+
+
+@pytest.mark.parametrize("rdf_format", ["turtle", "nt"])
+def test_rdf_generator_direct_writer_matches_rdflib(rdf_format):
+    """Test directly written Turtle/N-Triples match the rdflib graph output."""
+    generator = RDFGeneratorPlugin()
+    data = [{"id": "1", 'quote "and" \\slash': "x\ny", "naïve": "1.5"}]
+    dataset_uri = "http://example.org/test"
+
+    direct = generator.execute(data, format=rdf_format, dataset_uri=dataset_uri)
+    via_rdflib = generator.execute(data, format="xml", dataset_uri=dataset_uri)
+
+    assert isomorphic(
+        Graph().parse(data=direct, format=rdf_format),
+        Graph().parse(data=via_rdflib, format="xml"),
+    )
+
+
+@pytest.mark.parametrize("key", [None, True, 1.5, 7])
+def test_rdf_generator_non_string_column_names(key):
+    """Test non-string column names give valid Turtle, as with rdflib."""
+    generator = RDFGeneratorPlugin()
+    data = [{"a": "1", key: "2"}]
+    dataset_uri = "http://example.org/test"
+
+    rdf_output = generator.execute(data, dataset_uri=dataset_uri)
+    via_rdflib = generator.execute(data, format="xml", dataset_uri=dataset_uri)
+
+    assert isomorphic(
+        Graph().parse(data=rdf_output, format="turtle"),
+        Graph().parse(data=via_rdflib, format="xml"),
+    )
+
+
+def test_rdf_generator_turtle_groups_triples_by_subject():
+    """Test Turtle output has one block per subject: dataset, schema, columns."""
+    generator = RDFGeneratorPlugin()
+    data = [{"id": "1", "name": "Alice", "age": "30"}]
+
+    rdf_output = generator.execute(data, dataset_uri="http://example.org/test")
+    blocks = rdf_output.split("\n\n")[1:]
+
+    subjects = [block.split(" ", 1)[0] for block in blocks if block]
+    assert subjects == [
+        "<http://example.org/test>",
+        "<http://example.org/test/schema>",
+        "<http://example.org/test/schema/column/0>",
+        "<http://example.org/test/schema/column/1>",
+        "<http://example.org/test/schema/column/2>",
+    ]
+
+
 def test_rdf_generator_namespaces():
     """Test that RDF generator includes proper namespaces."""
     generator = RDFGeneratorPlugin()
@@ -64,3 +271,45 @@ def test_rdf_generator_namespaces():
     assert "healthdcat:" in rdf_output
     assert "dcat:" in rdf_output
     assert "dct:" in rdf_output
+
+
+@pytest.mark.parametrize("rdf_format", ["jelly", "jelly-noprefix-sm"])
+def test_rdf_generator_jelly_matches_turtle(rdf_format, tmp_path):
+    """Test Jelly output holds the same triples as Turtle."""
+    pytest.importorskip("pyjelly")
+    generator = RDFGeneratorPlugin()
+    data = [{"id": "1", "value": "1.5"}]
+    expected = Graph().parse(data=generator.execute(data), format="turtle")
+
+    result = generator.execute(data, format=rdf_format)
+    assert isinstance(result, bytes)
+    assert isomorphic(Graph().parse(data=result, format="jelly"), expected)
+
+    # Text streams are written through their binary buffer
+    output_path = tmp_path / "out.jelly"
+    with open(output_path, "w", encoding="utf-8") as out:
+        assert generator.execute(data, format=rdf_format, out=out) == ""
+    assert output_path.read_bytes() == result
+
+
+def test_rdf_generator_jelly_rejects_text_only_stream():
+    """Test Jelly output to a stream without a binary buffer fails clearly."""
+    pytest.importorskip("pyjelly")
+    generator = RDFGeneratorPlugin()
+
+    with pytest.raises(TypeError, match="binary"):
+        generator.execute([{"id": "1"}], format="jelly", out=io.StringIO())
+
+
+def test_plugins_import_optional_dependencies_lazily():
+    """Test loading the plugins doesn't import pyarrow or pyjelly."""
+    code = (
+        "import sys\n"
+        "from healthdcat_converter import PluginLoader\n"
+        "PluginLoader(use_cache=False).load_plugins()\n"
+        "assert 'pyarrow' not in sys.modules and 'pyjelly' not in sys.modules\n"
+    )
+    src_dir = Path(__file__).parent.parent / "src"
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
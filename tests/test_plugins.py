@@ -1,5 +1,8 @@
 """Unit tests for the plugin system."""
 
+import importlib
+import json
+
 import pytest
 from healthdcat_converter import PluginBase, PluginLoader
 
@@ -53,6 +56,18 @@ def test_plugin_execution():
     assert result[0]["_plugin"] == "custom_transform"
 
 
+@pytest.mark.parametrize("test_data", [[{"a": 1}, "x"], ["x", {"a": 1}]])
+def test_plugin_execution_on_mixed_rows(test_data):
+    """Test the custom transform plugin only transforms dictionary rows."""
+    loader = PluginLoader()
+    loader.load_plugins()
+
+    result = loader.get_instance("custom_transform").execute(test_data)
+
+    assert "x" in result
+    assert {"a": 1, "_transformed": True, "_plugin": "custom_transform"} in result
+
+
 def test_plugin_not_found():
     """Test that getting a non-existent plugin raises an error."""
     loader = PluginLoader()
@@ -69,3 +84,81 @@ def test_list_all_plugins():
 
     assert isinstance(plugins, list)
     assert len(plugins) >= 4  # At least our 4 default plugins
+
+
+def test_get_instance_is_cached():
+    """Test that plugin instances are created once and reused."""
+    loader = PluginLoader()
+    loader.load_plugins()
+
+    instance = loader.get_instance("rdf_generator")
+
+    assert isinstance(instance, loader.get_plugin("rdf_generator"))
+    assert loader.get_instance("rdf_generator") is instance
+
+
+def test_plugin_execution_on_arrow_table():
+    """Test the custom transform plugin appends columns to an Arrow table."""
+    pa = pytest.importorskip("pyarrow")
+    loader = PluginLoader()
+    loader.load_plugins()
+
+    transform_plugin = loader.get_instance("custom_transform")
+    table = pa.table({"name": ["a", "b"]})
+    result = transform_plugin.execute(table)
+
+    assert result.column_names == ["name", "_transformed", "_plugin"]
+    assert result.column("_transformed").to_pylist() == [True, True]
+    assert result.column("_plugin").to_pylist() == ["custom_transform"] * 2
+
+
+def test_discovered_modules_are_cached(tmp_path):
+    """Test the plugin module list is cached and reused while fresh."""
+    loader = PluginLoader(cache_dir=tmp_path)
+    plugins_dir = importlib.import_module(loader.plugins_package).__path__[0]
+
+    modules = loader._discover_modules([plugins_dir])
+    assert "csv_reader" in modules
+    assert loader.cache_file.exists()
+
+    # A fresh cache entry is used without rescanning the directory
+    cache = json.loads(loader.cache_file.read_text())
+    cache[plugins_dir]["modules"] = ["cached_only"]
+    loader.cache_file.write_text(json.dumps(cache))
+    assert PluginLoader(cache_dir=tmp_path)._discover_modules([plugins_dir]) == [
+        "cached_only"
+    ]
+
+
+def test_load_plugins_returns_fresh_list():
+    """Test the plugin list is a copy that reflects newly registered plugins."""
+    loader = PluginLoader()
+    loader.load_plugins().clear()
+    assert "csv_reader" in loader.load_plugins()
+
+    try:
+
+        class ProbePlugin(PluginBase):
+            @classmethod
+            def get_name(cls) -> str:
+                return "registry_probe"
+
+            def execute(self, data, **kwargs):
+                return data
+
+        assert "registry_probe" in loader.load_plugins()
+    finally:
+        PluginBase._registry.pop("registry_probe", None)
+
+
+def test_broken_plugin_module_raises(tmp_path, monkeypatch):
+    """Test a plugin module that fails to import raises at discovery."""
+    package_dir = tmp_path / "broken_plugins"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "broken.py").write_text("def broken(:\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    loader = PluginLoader(plugins_package="broken_plugins", use_cache=False)
+    with pytest.raises(SyntaxError):
+        loader.load_plugins()